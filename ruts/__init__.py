@@ -5,17 +5,40 @@
 #         Смирнова Екатерина <ekanerina@yandex.ru>
 # URL: <https://github.com/SergeyShk/ruTS>
 
-from .basic_stats import BasicStats
+from typing import Any, List
+
+import importlib
+
+# Компоненты импортируются сразу, так как при импорте регистрируются фабрики spaCy
 from .components import (
     BasicStatsComponent,
     DiversityStatsComponent,
     MorphStatsComponent,
     ReadabilityStatsComponent,
 )
-from .diversity_stats import DiversityStats
-from .extractors import SentsExtractor, WordsExtractor
-from .morph_stats import MorphStats
-from .readability_stats import ReadabilityStats
+
+# Остальные классы загружаются при первом обращении (PEP 562)
+_LAZY_IMPORTS = {
+    "BasicStats": ".basic_stats",
+    "DiversityStats": ".diversity_stats",
+    "SentsExtractor": ".extractors",
+    "WordsExtractor": ".extractors",
+    "MorphStats": ".morph_stats",
+    "ReadabilityStats": ".readability_stats",
+}
+
+
+def __getattr__(name: str) -> Any:
+    if name not in _LAZY_IMPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(_LAZY_IMPORTS[name], __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(_LAZY_IMPORTS))
+
 
 # Метаданные
 
@@ -1,12 +1,31 @@
-from typing import Dict, Union
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple, Union
 
-from collections import Counter
+import os
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
 
+import numpy as np
 from spacy.tokens import Doc
 
-from .constants import BASIC_STATS_DESC, COMPLEX_SYL_FACTOR, PUNCTUATIONS, RU_LETTERS, SPACES
+from .constants import (
+    BASIC_STATS_DESC,
+    CHAR_CLASSES_BITMAP,
+    CHAR_LETTER,
+    CHAR_PUNCTUATION,
+    CHAR_SPACE,
+    CHAR_VOWEL,
+    COMPLEX_SYL_FACTOR,
+)
 from .extractors import SentsExtractor, WordsExtractor
-from .utils import count_syllables
+
+# Битовые флаги классов символов, индексируемые кодом символа (коды вне таблицы - 0)
+_CHAR_CLASSES_TABLE = np.frombuffer(CHAR_CLASSES_BITMAP, dtype=np.uint8)
+
+# Формат строки таблицы в print_stats
+_ROW_FORMAT = "{:20}|{:^10}".format
+
+# Функция вычисления статистик в рабочем процессе from_texts
+_worker_compute_stats: Optional[Callable[[str], "BasicStats"]] = None
 
 
 class BasicStats:
@@ -69,12 +88,40 @@ class BasicStats:
     Методы:
         get_stats: Получение вычисленных статистик текста
         print_stats: Отображение вычисленных статистик текста с описанием на экран
+        from_texts: Вычисление основных статистик для набора текстов в нескольких процессах
 
     Исключения:
         TypeError: Если передаваемое значение не является строкой или объектом Doc
         ValueError: Если в источнике данных отсутствуют слова
     """
 
+    __slots__ = (
+        "c_letters",
+        "c_syllables",
+        "n_sents",
+        "n_words",
+        "n_unique_words",
+        "n_long_words",
+        "n_complex_words",
+        "n_simple_words",
+        "n_monosyllable_words",
+        "n_polysyllable_words",
+        "n_chars",
+        "n_letters",
+        "n_spaces",
+        "n_syllables",
+        "n_punctuations",
+        "p_unique_words",
+        "p_long_words",
+        "p_complex_words",
+        "p_simple_words",
+        "p_monosyllable_words",
+        "p_polysyllable_words",
+        "p_letters",
+        "p_spaces",
+        "p_punctuations",
+    )
+
     def __init__(
         self,
         source: Union[str, Doc],
@@ -86,6 +133,7 @@ class BasicStats:
             text = source.text
             sents = source.sents
             words = tuple(word.text for word in source)
+            is_lowercase = False
         elif isinstance(source, str):
             text = source
             if not sents_extractor:
@@ -94,30 +142,33 @@ class BasicStats:
             if not words_extractor:
                 words_extractor = WordsExtractor()
             words = words_extractor.extract(text)
+            is_lowercase = words_extractor.lowercase
         else:
             raise TypeError("Некорректный источник данных")
         if not words:
             raise ValueError("В источнике данных отсутствуют слова")
 
-        letters_per_word = tuple(len(word) for word in words)
-        syllables_per_word = tuple(count_syllables(word) for word in words)
-        self.c_letters = dict(sorted(Counter(letters_per_word).items()))
-        self.c_syllables = dict(sorted(Counter(syllables_per_word).items()))
-        self.n_sents = sum(1 for sent in sents)
+        n_letters, n_spaces, n_punctuations = _count_char_classes(text)
+        words_len = np.fromiter(map(len, words), dtype=np.int32, count=len(words))
+        syllables_per_word = _count_syllables_per_word(words, words_len)
+        syllables_counts = np.bincount(syllables_per_word, minlength=2)
+        self.c_letters = _to_frequencies(np.bincount(words_len))
+        self.c_syllables = _to_frequencies(syllables_counts)
+        self.n_sents = len(sents) if hasattr(sents, "__len__") else sum(1 for sent in sents)
         self.n_words = len(words)
-        self.n_unique_words = len({word.lower() for word in words})
-        self.n_long_words = sum(1 for cpw in letters_per_word if cpw >= 6)
-        self.n_complex_words = sum(1 for spw in syllables_per_word if spw >= COMPLEX_SYL_FACTOR)
-        self.n_simple_words = sum(1 for spw in syllables_per_word if COMPLEX_SYL_FACTOR > spw > 0)
-        self.n_monosyllable_words = self.c_syllables.get(1, 0)
-        self.n_polysyllable_words = (
-            self.n_words - self.c_syllables.get(1, 0) - self.c_syllables.get(0, 0)
+        self.n_unique_words = len(set(words if is_lowercase else map(str.lower, words)))
+        self.n_long_words = int(np.count_nonzero(words_len >= 6))
+        self.n_complex_words = int(np.count_nonzero(syllables_per_word >= COMPLEX_SYL_FACTOR))
+        self.n_simple_words = int(
+            np.count_nonzero((syllables_per_word > 0) & (syllables_per_word < COMPLEX_SYL_FACTOR))
         )
-        self.n_chars = len(text.replace("\n", ""))
-        self.n_letters = sum((1 for char in text if char in RU_LETTERS))
-        self.n_spaces = sum((1 for char in text if char in SPACES))
-        self.n_syllables = sum(syllables_per_word)
-        self.n_punctuations = sum((1 for char in text if char in PUNCTUATIONS))
+        self.n_monosyllable_words = int(syllables_counts[1])
+        self.n_polysyllable_words = self.n_words - int(syllables_counts[:2].sum())
+        self.n_chars = len(text) - text.count("\n")
+        self.n_letters = n_letters
+        self.n_spaces = n_spaces
+        self.n_syllables = int(syllables_per_word.sum())
+        self.n_punctuations = n_punctuations
 
         if normalize:
             self.p_unique_words = self.n_unique_words / self.n_words
@@ -137,11 +188,147 @@ class BasicStats:
         Вывод:
             dict[str, int]: Справочник вычисленных статистик текста
         """
-        return vars(self)
+        return {stat: getattr(self, stat) for stat in self.__slots__ if hasattr(self, stat)}
 
     def print_stats(self):
         """Отображение вычисленных статистик текста с описанием на экран"""
         print(f"{'Статистика':^20}|{'Значение':^10}")
         print("-" * 30)
+        stats = self.get_stats()
         for stat, value in BASIC_STATS_DESC.items():
-            print(f"{value:20}|{self.get_stats().get(stat):^10}")
+            print(_ROW_FORMAT(value, stats.get(stat)))
+
+    @classmethod
+    def from_texts(
+        cls,
+        texts: Iterable[str],
+        sents_extractor: SentsExtractor = None,
+        words_extractor: WordsExtractor = None,
+        normalize: bool = False,
+        workers: int = None,
+    ) -> List["BasicStats"]:
+        """
+        Вычисление основных статистик для набора текстов в нескольких процессах
+
+        Аргументы:
+            texts (Iterable[str]): Набор текстов
+            sents_extractor (SentsExtractor): Инструмент для извлечения предложений
+            words_extractor (WordsExtractor): Инструмент для извлечения слов
+            normalize (bool): Вычислять нормализованные статистики
+            workers (int): Количество процессов (по умолчанию - количество ядер процессора)
+
+        Вывод:
+            list[BasicStats]: Статистики текстов в порядке их следования
+        """
+        texts = list(texts)
+        workers = workers or os.cpu_count() or 1
+        sents_config = sents_extractor._get_config() if sents_extractor else None
+        words_config = words_extractor._get_config() if words_extractor else None
+        chunksize = max(1, len(texts) // (workers * 4))
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_stats_worker,
+            initargs=(cls, sents_config, words_config, normalize),
+        ) as executor:
+            return list(executor.map(_compute_stats, texts, chunksize=chunksize))
+
+
+def _init_stats_worker(
+    cls: type,
+    sents_config: Optional[Dict[str, Any]],
+    words_config: Optional[Dict[str, Any]],
+    normalize: bool,
+) -> None:
+    """
+    Создание инструментов для извлечения предложений и слов в рабочем процессе
+
+    Аргументы:
+        cls (type): Класс вычисляемых статистик
+        sents_config (dict[str, Any]): Аргументы конструктора SentsExtractor
+        words_config (dict[str, Any]): Аргументы конструктора WordsExtractor
+        normalize (bool): Вычислять нормализованные статистики
+    """
+    global _worker_compute_stats
+    _worker_compute_stats = partial(
+        cls,
+        sents_extractor=SentsExtractor(**sents_config) if sents_config is not None else None,
+        words_extractor=WordsExtractor(**words_config) if words_config is not None else None,
+        normalize=normalize,
+    )
+
+
+def _compute_stats(text: str) -> "BasicStats":
+    """
+    Вычисление основных статистик текста в рабочем процессе
+
+    Аргументы:
+        text (str): Строка текста
+
+    Вывод:
+        BasicStats: Основные статистики текста
+    """
+    return _worker_compute_stats(text)
+
+
+def _to_codes(text: str) -> np.ndarray:
+    """
+    Преобразование строки в массив кодов символов
+
+    Аргументы:
+        text (str): Строка
+
+    Вывод:
+        ndarray: Коды символов строки
+    """
+    return np.frombuffer(text.encode("utf-32-le", errors="surrogatepass"), dtype=np.uint32)
+
+
+def _count_char_classes(text: str) -> Tuple[int, int, int]:
+    """
+    Подсчет количества букв, пробелов и знаков пунктуации в тексте
+
+    Аргументы:
+        text (str): Текст
+
+    Вывод:
+        tuple[int, int, int]: Количество букв, пробелов и знаков пунктуации
+    """
+    flags_counts = np.bincount(_CHAR_CLASSES_TABLE.take(_to_codes(text), mode="clip"))
+    flags = np.arange(len(flags_counts))
+    return tuple(
+        int(flags_counts[(flags & flag) != 0].sum())
+        for flag in (CHAR_LETTER, CHAR_SPACE, CHAR_PUNCTUATION)
+    )
+
+
+def _to_frequencies(counts: np.ndarray) -> Dict[int, int]:
+    """
+    Преобразование массива частот в словарь ненулевых частот
+
+    Аргументы:
+        counts (ndarray): Массив частот, индексированный значениями
+
+    Вывод:
+        dict[int, int]: Упорядоченный по значению словарь частот
+    """
+    return {int(value): int(counts[value]) for value in np.flatnonzero(counts)}
+
+
+def _count_syllables_per_word(words: Sequence[str], words_len: np.ndarray) -> np.ndarray:
+    """
+    Вычисление количества слогов в каждом слове за один векторизованный проход
+
+    Аргументы:
+        words (tuple[str]): Кортеж слов
+        words_len (ndarray): Длины слов
+
+    Вывод:
+        ndarray: Количество слогов в каждом слове
+    """
+    codes = _to_codes("".join(words))
+    vowels_cumsum = np.zeros(len(codes) + 1, dtype=np.int64)
+    is_vowel = (_CHAR_CLASSES_TABLE.take(codes, mode="clip") & CHAR_VOWEL) != 0
+    np.cumsum(is_vowel, out=vowels_cumsum[1:])
+    offsets = np.zeros(len(words_len) + 1, dtype=np.int64)
+    np.cumsum(words_len, out=offsets[1:])
+    return np.diff(vowels_cumsum[offsets])
@@ -1,11 +1,6 @@
 from spacy.language import Language
 from spacy.tokens import Doc
 
-from .basic_stats import BasicStats
-from .diversity_stats import DiversityStats
-from .morph_stats import MorphStats
-from .readability_stats import ReadabilityStats
-
 
 @Language.factory("basic")
 class BasicStatsComponent:
@@ -43,6 +38,8 @@ class BasicStatsComponent:
         Вывод:
             doc (Doc): Модифицированный объект Doc
         """
+        from .basic_stats import BasicStats
+
         bs = BasicStats(doc)
         doc._.set(self.name, bs)
         return doc
@@ -83,6 +80,8 @@ class MorphStatsComponent:
         Вывод:
             doc (Doc): Модифицированный объект Doc
         """
+        from .morph_stats import MorphStats
+
         ms = MorphStats(doc)
         doc._.set(self.name, ms)
         return doc
@@ -123,6 +122,8 @@ class ReadabilityStatsComponent:
         Вывод:
             doc (Doc): Модифицированный объект Doc
         """
+        from .readability_stats import ReadabilityStats
+
         rs = ReadabilityStats(doc)
         doc._.set(self.name, rs)
         return doc
@@ -163,6 +164,8 @@ class DiversityStatsComponent:
         Вывод:
             doc (Doc): Модифицированный объект Doc
         """
+        from .diversity_stats import DiversityStats
+
         ds = DiversityStats(doc)
         doc._.set(self.name, ds)
         return doc
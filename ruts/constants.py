@@ -2,20 +2,31 @@ import string
 from pathlib import Path
 
 DEFAULT_DATA_DIR = Path(__file__).parent.parent.resolve() / "ruts_data"
-RU_VOWELS = ["а", "е", "и", "у", "о", "я", "ё", "э", "ю", "ы"]
-RU_VOWELS += list(map(str.upper, RU_VOWELS))
-RU_CONSONANTS_LOW = ["к", "п", "с", "т", "ф", "х", "ц", "ч", "ш", "щ"]
-RU_CONSONANTS_LOW += list(map(str.upper, RU_CONSONANTS_LOW))
-RU_CONSONANTS_HIGH = ["б", "в", "г", "д", "ж", "з"]
-RU_CONSONANTS_HIGH += list(map(str.upper, RU_CONSONANTS_HIGH))
-RU_CONSONANTS_SONOR = ["л", "м", "н", "р"]
-RU_CONSONANTS_SONOR += list(map(str.upper, RU_CONSONANTS_SONOR))
-RU_CONSONANTS_YET = ["й", "Й"]
-RU_CONSONANTS = RU_CONSONANTS_HIGH + RU_CONSONANTS_LOW + RU_CONSONANTS_SONOR + RU_CONSONANTS_YET
-RU_MARKS = ["ь", "ъ", "Ь", "Ъ"]
-RU_LETTERS = RU_CONSONANTS + RU_MARKS + RU_VOWELS
+RU_VOWELS = frozenset("аеиуояёэюыАЕИУОЯЁЭЮЫ")
+RU_CONSONANTS_LOW = frozenset("кпстфхцчшщКПСТФХЦЧШЩ")
+RU_CONSONANTS_HIGH = frozenset("бвгджзБВГДЖЗ")
+RU_CONSONANTS_SONOR = frozenset("лмнрЛМНР")
+RU_CONSONANTS_YET = frozenset("йЙ")
+RU_CONSONANTS = RU_CONSONANTS_HIGH | RU_CONSONANTS_LOW | RU_CONSONANTS_SONOR | RU_CONSONANTS_YET
+RU_MARKS = frozenset("ьъЬЪ")
+RU_LETTERS = RU_CONSONANTS | RU_MARKS | RU_VOWELS
 PUNCTUATIONS = string.punctuation + "—«»“”..."
-SPACES = [" ", "\t"]
+PUNCTUATIONS_SET = frozenset(PUNCTUATIONS)
+SPACES = frozenset(" \t")
+CHAR_LETTER = 1
+CHAR_VOWEL = 2
+CHAR_SPACE = 4
+CHAR_PUNCTUATION = 8
+CHAR_CLASSES = {
+    CHAR_LETTER: RU_LETTERS,
+    CHAR_VOWEL: RU_VOWELS,
+    CHAR_SPACE: SPACES,
+    CHAR_PUNCTUATION: PUNCTUATIONS_SET,
+}
+CHAR_CLASSES_BITMAP = bytes(
+    sum(flag for flag, chars in CHAR_CLASSES.items() if chr(code) in chars)
+    for code in range(max(ord(char) for chars in CHAR_CLASSES.values() for char in chars) + 2)
+)
 COMPLEX_SYL_FACTOR = 4
 BASIC_STATS_DESC = {
     "n_sents": "Предложения",
@@ -1,6 +1,16 @@
-from typing import Any, Dict, Generator
+from typing import Any, Callable, Dict, Generator, List, Tuple
 
+import os
+import pickle
+import re
 from abc import ABCMeta, abstractmethod
+from pathlib import Path
+
+# Значение заголовка записи в строке вида "Наименование: значение"
+HEADER_PATTERN = re.compile(r"^[^:\n]*:[^:\n]?([^:\n]*)", re.MULTILINE)
+
+# Версия формата кэша записей на диске (увеличивается при изменении разбора записей)
+RECORDS_CACHE_VERSION = 1
 
 
 class Dataset(metaclass=ABCMeta):
@@ -16,9 +26,11 @@ class Dataset(metaclass=ABCMeta):
         get_texts: Получение текстов (без заголовков) из набора данных
         get_records: Получение записей (с заголовками) из набора данных
         download: Загрузка набора данных из сети
+        clear_cache: Очистка кэша записей в памяти
     """
 
     __test__ = False
+    _records_cache: Dict[Path, Tuple[int, List[Dict[str, Any]]]] = {}
 
     @abstractmethod
     def __init__(self, name, meta=None):
@@ -34,6 +46,81 @@ class Dataset(metaclass=ABCMeta):
         info.update(self.meta)
         return info
 
+    @classmethod
+    def clear_cache(cls):
+        """
+        Очистка кэша записей в памяти
+        """
+        cls._records_cache.clear()
+
+    @classmethod
+    def _load_cached_records(
+        cls, dirpath: Path, load_records: Callable[[Path], List[Dict[str, Any]]]
+    ) -> List[Dict[str, Any]]:
+        """
+        Загрузка записей директории из кэша или из файлов набора данных
+
+        Записи кэшируются в памяти и на диске, кэш перестраивается при изменении директории
+        или любого из ее файлов
+
+        Аргументы:
+            dirpath (Path): Путь к директории набора данных
+            load_records (callable): Функция загрузки записей из файлов директории
+
+        Вывод:
+            list[dict[str, object]]: Список записей
+        """
+        with os.scandir(dirpath) as entries:
+            mtime = max(
+                [dirpath.stat().st_mtime_ns] + [entry.stat().st_mtime_ns for entry in entries]
+            )
+        cached = cls._records_cache.get(dirpath)
+        if cached is None or cached[0] != mtime:
+            cls._records_cache[dirpath] = cached = (
+                mtime,
+                cls.__load_pickled_records(dirpath, mtime, load_records),
+            )
+        return [dict(record) for record in cached[1]]
+
+    @staticmethod
+    def __load_pickled_records(
+        dirpath: Path, mtime: int, load_records: Callable[[Path], List[Dict[str, Any]]]
+    ) -> List[Dict[str, Any]]:
+        """
+        Загрузка записей директории из кэша на диске или из файлов набора данных
+
+        Аргументы:
+            dirpath (Path): Путь к директории набора данных
+            mtime (int): Время последнего изменения директории и ее файлов в наносекундах
+            load_records (callable): Функция загрузки записей из файлов директории
+
+        Вывод:
+            list[dict[str, object]]: Список записей
+        """
+        cachepath = dirpath.with_name(f"{dirpath.name}.pkl")
+        try:
+            with open(cachepath, "rb") as f:
+                cached = pickle.load(f)
+            if cached[:2] == (RECORDS_CACHE_VERSION, mtime):
+                records = cached[2]
+                for record in records:
+                    record["file"] = dirpath.joinpath(record["file"])
+                return records
+        except (OSError, EOFError, pickle.UnpicklingError):
+            pass
+        records = load_records(dirpath)
+        cached_records = [{**record, "file": Path(record["file"]).name} for record in records]
+        try:
+            with open(cachepath, "wb") as f:
+                pickle.dump(
+                    (RECORDS_CACHE_VERSION, mtime, cached_records),
+                    f,
+                    protocol=pickle.HIGHEST_PROTOCOL,
+                )
+        except OSError:
+            pass
+        return records
+
     @abstractmethod
     def __iter__(self):
         raise NotImplementedError
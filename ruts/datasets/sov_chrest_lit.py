@@ -1,13 +1,15 @@
-from typing import Any, Dict, Generator, List, Optional, Union
+from typing import Any, Dict, Generator, List, Optional, Tuple, Union
 
 import os
-import re
+import sys
+from concurrent.futures import ThreadPoolExecutor
 from itertools import islice
+from operator import itemgetter
 from pathlib import Path
 
 from ..constants import DEFAULT_DATA_DIR
 from ..utils import download_file, extract_archive, to_path
-from .dataset import Dataset
+from .dataset import HEADER_PATTERN, Dataset
 
 NAME = "sov_chrest_lit"
 META = {
@@ -28,6 +30,8 @@ TEXT_TYPES = [
     "Басня",
 ]
 DEFAULT_DATASET_DIR = DEFAULT_DATA_DIR.joinpath("texts")
+_VALID_GRADES = frozenset(range(1, 12))
+_TEXT_TYPES = frozenset(TEXT_TYPES)
 
 
 class SovChLit(Dataset):
@@ -133,6 +137,8 @@ class SovChLit(Dataset):
         if filepath:
             extract_archive(filepath)
         self.check_data()
+        for label in self.labels:
+            self.__load_label(label)
 
     def get_texts(
         self,
@@ -168,7 +174,7 @@ class SovChLit(Dataset):
         filters = self.__get_filters(
             grade, book, year, category, text_type, subject, author, min_len, max_len
         )
-        for record in islice(self.__filtered_iter(filters), limit):
+        for record in islice(self.__filtered_iter(filters, self.__get_labels(grade)), limit):
             yield record["text"]
 
     def get_records(
@@ -205,38 +211,100 @@ class SovChLit(Dataset):
         filters = self.__get_filters(
             grade, book, year, category, text_type, subject, author, min_len, max_len
         )
-        yield from islice(self.__filtered_iter(filters), limit)
+        yield from islice(self.__filtered_iter(filters, self.__get_labels(grade)), limit)
 
     def __iter__(self) -> Generator[Dict[str, Any], None, None]:
         """
         Итерация по набору данных
 
+        Вывод:
+            generator[dict[str, object]]: Генератор записей
+        """
+        yield from self.__iter_labels(self.labels)
+
+    def __iter_labels(self, labels: Tuple[str, ...]) -> Generator[Dict[str, Any], None, None]:
+        """
+        Итерация по записям выбранных директорий набора данных
+
+        Аргументы:
+            labels (tuple[str]): Кортеж директорий набора данных
+
         Вывод:
             generator[dict[str, object]]: Генератор записей
         """
         self.check_data()
-        dirpaths = (self.data_dir.joinpath(NAME, label) for label in self.labels)
-        for dirpath in dirpaths:
-            for filepath in os.listdir(dirpath):
-                if re.match(r"[0-9]+", filepath):
-                    yield self.__load_record(dirpath.joinpath(filepath))
+        for label in labels:
+            yield from self.__load_label(label)
+
+    def __get_labels(self, grade: int) -> Tuple[str, ...]:
+        """
+        Получение директорий набора данных, в которых могут находиться отфильтрованные записи
+
+        Аргументы:
+            grade (int): Уровень сложности текстов
+
+        Вывод:
+            tuple[str]: Кортеж директорий набора данных
+        """
+        if not grade:
+            return self.labels
+        return tuple(label for label in self.labels if label == f"grade_{grade}")
+
+    def __load_label(self, label: str) -> List[Dict[str, Any]]:
+        """
+        Загрузка записей уровня из кэша или из файлов набора данных
 
-    def __filtered_iter(self, filters) -> Generator[Dict[str, Any], None, None]:
+        Аргументы:
+            label (str): Уровень сложности текстов
+
+        Вывод:
+            list[dict[str, object]]: Список записей
+        """
+        return self._load_cached_records(
+            self.data_dir.joinpath(NAME, label), self.__load_dir_records
+        )
+
+    def __load_dir_records(self, dirpath: Path) -> List[Dict[str, Any]]:
+        """
+        Загрузка записей из файлов директории набора данных
+
+        Аргументы:
+            dirpath (Path): Путь к директории набора данных
+
+        Вывод:
+            list[dict[str, object]]: Список записей
+        """
+        with os.scandir(dirpath) as entries:
+            filepaths = [
+                Path(entry.path)
+                for entry in entries
+                if entry.name[:1].isdigit() and entry.is_file()
+            ]
+        with ThreadPoolExecutor() as executor:
+            return list(executor.map(self.__load_record, filepaths))
+
+    def __filtered_iter(
+        self, filters, labels: Tuple[str, ...]
+    ) -> Generator[Dict[str, Any], None, None]:
         """
         Итерация по набору данных с учетом фильтров
 
         Аргументы:
             filters (list[str]): Список фильтров
+            labels (tuple[str]): Кортеж директорий набора данных
 
         Вывод:
             generator[dict[str, object]]: Генератор записей
         """
-        if filters:
-            for record in self:
-                if all(filter_(record) for filter_ in filters):
-                    yield record
-        else:
-            for record in self:
+        records = self.__iter_labels(labels)
+        if not filters:
+            yield from records
+            return
+        for record in records:
+            for filter_ in filters:
+                if not filter_(record):
+                    break
+            else:
                 yield record
 
     @staticmethod
@@ -251,25 +319,27 @@ class SovChLit(Dataset):
             dict[str, object]: Справочник полей загруженной записи
 
         Исключения:
+            OSError: Если не удалось прочитать файл
             ValueError: Если не удалось извлечь записи из файла
         """
+        with open(filepath, encoding="utf-8") as f:
+            data = f.read().strip()
         try:
-            with open(filepath, encoding="utf-8") as f:
-                headers, text = f.read().strip().split("\n\n")
-                headers = tuple(header.split(":")[1][1:] for header in headers.split("\n"))
+            headers_end = data.index("\n\n")
+            headers = HEADER_PATTERN.findall(data, 0, headers_end)
             return {
                 "grade": int(headers[0]),
-                "book": headers[1],
+                "book": sys.intern(headers[1]),
                 "year": int(headers[2]),
-                "category": headers[3],
-                "type": headers[4],
+                "category": sys.intern(headers[3]),
+                "type": sys.intern(headers[4]),
                 "subject": headers[5],
                 "author": headers[6],
-                "text": text,
+                "text": data[headers_end + 2 :],
                 "file": filepath,
             }
-        except Exception:
-            raise ValueError("Не удалось извлечь записи из файла")
+        except (ValueError, IndexError) as e:
+            raise ValueError(f"Не удалось извлечь записи из файла {filepath}") from e
 
     @staticmethod
     def __get_filters(
@@ -308,27 +378,23 @@ class SovChLit(Dataset):
             ValueError: Если минимальная длина текста больше максимальной
         """
         filters = []
+        equal_fields = {}
         if grade:
-            if grade not in range(1, 12):
+            if grade not in _VALID_GRADES:
                 raise ValueError(f"Некорректно выбран уровень текста (1-11) - {grade}")
-            filters.append(lambda record: record.get("grade", "") == grade)
-        if book:
-            pattern = re.compile(f".*{book}.*", re.IGNORECASE)
-            filters.append(lambda record: len(re.findall(pattern, record.get("book", ""))) > 0)
+            equal_fields["grade"] = grade
         if year:
-            filters.append(lambda record: record.get("year", "") == year)
+            equal_fields["year"] = year
         if category:
-            filters.append(lambda record: record.get("category", "") == category)
+            equal_fields["category"] = category
         if text_type:
-            if text_type not in TEXT_TYPES:
+            if text_type not in _TEXT_TYPES:
                 raise ValueError(f"Некорректно выбран тип текста - {text_type}")
-            filters.append(lambda record: record.get("type", "") == text_type)
-        if subject:
-            pattern = re.compile(f".*{subject}.*", re.IGNORECASE)
-            filters.append(lambda record: len(re.findall(pattern, record.get("subject", ""))) > 0)
-        if author:
-            pattern = re.compile(f".*{author}.*", re.IGNORECASE)
-            filters.append(lambda record: len(re.findall(pattern, record.get("author", ""))) > 0)
+            equal_fields["type"] = text_type
+        if equal_fields:
+            get_fields = itemgetter(*equal_fields)
+            values = get_fields(equal_fields)
+            filters.append(lambda record: get_fields(record) == values)
         if min_len:
             if min_len < 1:
                 raise ValueError("Минимальная длина текста должна быть больше 0")
@@ -339,4 +405,13 @@ class SovChLit(Dataset):
             filters.append(lambda record: len(record.get("text", "")) <= max_len)
         if min_len and max_len and min_len > max_len:
             raise ValueError("Минимальная длина текста больше максимальной")
+        if book:
+            book_needle = book.casefold()
+            filters.append(lambda record: book_needle in record.get("book", "").casefold())
+        if subject:
+            subject_needle = subject.casefold()
+            filters.append(lambda record: subject_needle in record.get("subject", "").casefold())
+        if author:
+            author_needle = author.casefold()
+            filters.append(lambda record: author_needle in record.get("author", "").casefold())
         return filters
@@ -1,11 +1,10 @@
-from typing import Dict, List, Union
+from typing import Dict, List, Optional, Tuple, Union
 
 from collections import Counter
-from itertools import permutations
 from math import log10, sqrt
 
-from nltk import FreqDist
-from scipy.special import comb
+import numpy as np
+from scipy.special import gammaln
 from spacy.tokens import Doc
 
 from .constants import DIVERSITY_STATS_DESC
@@ -80,7 +79,7 @@ class DiversityStats:
     def __init__(self, source: Union[str, Doc], words_extractor: WordsExtractor = None):
         if isinstance(source, Doc):
             text = source.text
-            self.words = tuple(word.text for word in source)
+            self.words = tuple([word.text for word in source])
         elif isinstance(source, str):
             text = source
             if not words_extractor:
@@ -90,34 +89,36 @@ class DiversityStats:
             raise TypeError("Некорректный источник данных")
         if not self.words:
             raise ValueError("В источнике данных отсутствуют слова")
+        self._freqs = Counter(self.words)
+        self._token_type_stats = _token_type_metrics(len(self.words), len(self._freqs))
 
     @property
     def ttr(self):
-        return calc_ttr(self.words)
+        return self._token_type_stats["ttr"]
 
     @property
     def rttr(self):
-        return calc_rttr(self.words)
+        return self._token_type_stats["rttr"]
 
     @property
     def cttr(self):
-        return calc_cttr(self.words)
+        return self._token_type_stats["cttr"]
 
     @property
     def httr(self):
-        return calc_httr(self.words)
+        return self._token_type_stats["httr"]
 
     @property
     def sttr(self):
-        return calc_sttr(self.words)
+        return self._token_type_stats["sttr"]
 
     @property
     def mttr(self):
-        return calc_mttr(self.words)
+        return self._token_type_stats["mttr"]
 
     @property
     def dttr(self):
-        return calc_dttr(self.words)
+        return self._token_type_stats["dttr"]
 
     @property
     def mattr(self):
@@ -137,15 +138,15 @@ class DiversityStats:
 
     @property
     def hdd(self):
-        return calc_hdd(self.words, 42)
+        return calc_hdd(self.words, 42, self._freqs)
 
     @property
     def simpson_index(self):
-        return calc_simpson_index(self.words)
+        return calc_simpson_index(self.words, self._freqs)
 
     @property
     def hapax_index(self):
-        return calc_hapax_index(self.words)
+        return calc_hapax_index(self.words, self._freqs)
 
     def get_stats(self) -> Dict[str, float]:
         """
@@ -175,8 +176,54 @@ class DiversityStats:
         """Отображение вычисленных метрик лексического разнообразия текста с описанием на экран"""
         print(f"{'Метрика':^60}|{'Значение':^10}")
         print("-" * 70)
+        stats = self.get_stats()
         for stat, value in DIVERSITY_STATS_DESC.items():
-            print(f"{value:60}|{self.get_stats().get(stat):^10.2f}")
+            print(f"{value:60}|{stats.get(stat):^10.2f}")
+
+
+def _encode_words(text: List[str]) -> Tuple[List[int], int]:
+    """
+    Замена слов на целочисленные идентификаторы лексем в порядке их первого появления
+
+    Аргументы:
+        text (list[str]): Список слов
+
+    Вывод:
+        tuple[list[int], int]: Список идентификаторов лексем и количество лексем
+    """
+    lexemes = {}
+    ids = [lexemes.setdefault(word, len(lexemes)) for word in text]
+    return ids, len(lexemes)
+
+
+def _token_type_metrics(n_words: int, n_lexemes: int) -> Dict[str, float]:
+    """
+    Вычисление метрик, зависящих только от количества слов и лексем (TTR и ее модификаций)
+
+    Логарифмы количества слов и лексем вычисляются однократно для всех метрик
+
+    Аргументы:
+        n_words (int): Количество слов
+        n_lexemes (int): Количество лексем
+
+    Вывод:
+        dict[str, float]: Справочник вычисленных метрик
+    """
+    log_n_words = log10(n_words)
+    log_n_lexemes = log10(n_lexemes)
+    if n_words == 1 or n_lexemes == 1:
+        sttr = 0
+    else:
+        sttr = safe_divide(log10(log_n_lexemes), log10(log_n_words))
+    return {
+        "ttr": safe_divide(n_lexemes, n_words),
+        "rttr": safe_divide(n_lexemes, sqrt(n_words)),
+        "cttr": safe_divide(n_lexemes, sqrt(2 * n_words)),
+        "httr": safe_divide(log_n_lexemes, log_n_words),
+        "sttr": sttr,
+        "mttr": safe_divide(log_n_words - log_n_lexemes, log_n_words**2),
+        "dttr": safe_divide(log_n_words**2, log_n_words - log_n_lexemes),
+    }
 
 
 def calc_ttr(text: List[str]) -> float:
@@ -328,15 +375,19 @@ def calc_mattr(text: List[str], window_len: int = 50) -> float:
     if n_words < (window_len + 1):
         mattr = calc_ttr(text)
     else:
-        window_ttr = 0
-        window_count = 0
-        for n in range(n_words):
-            window = text[n : (n + window_len)]
-            if len(window) < window_len:
-                break
-            window_count += 1
-            window_ttr += len(set(window)) / float(window_len)
-        mattr = safe_divide(window_ttr, window_count)
+        ids = np.array(_encode_words(text)[0])
+        # Предыдущее вхождение каждой лексемы (-1 при его отсутствии)
+        order = np.argsort(ids, kind="stable")
+        repeats = ids[order[1:]] == ids[order[:-1]]
+        prev = np.full(n_words, -1)
+        prev[order[1:][repeats]] = order[:-1][repeats]
+        # Слово учитывается в тех окнах, где оно встречается впервые
+        positions = np.arange(n_words)
+        first_window = np.maximum(prev + 1, positions - window_len + 1)
+        last_window = np.minimum(positions, n_words - window_len)
+        window_lexemes = int(np.maximum(last_window - first_window + 1, 0).sum())
+        window_count = n_words - window_len + 1
+        mattr = safe_divide(window_lexemes, window_count * window_len)
     return mattr
 
 
@@ -358,15 +409,11 @@ def calc_msttr(text: List[str], segment_len: int = 50) -> float:
     if n_words < (segment_len + 1):
         msttr = calc_ttr(text)
     else:
-        segment_ttr = 0
-        segment_count = 0
-        seed = 0
-        for _ in range(int(n_words / segment_len)):
-            segment = text[seed : (seed + segment_len)]
-            segment_count += 1
-            seed += segment_len
-            segment_ttr += safe_divide(len(set(segment)), len(segment))
-        msttr = safe_divide(segment_ttr, segment_count)
+        segment_count = n_words // segment_len
+        ids = np.array(_encode_words(text[: segment_count * segment_len])[0])
+        segments = np.sort(ids.reshape(segment_count, segment_len), axis=1)
+        segment_lexemes = segment_count + np.count_nonzero(np.diff(segments, axis=1))
+        msttr = safe_divide(segment_lexemes, segment_count * segment_len)
     return msttr
 
 
@@ -389,28 +436,34 @@ def calc_mtld(text: List[str], min_len: int = 10) -> float:
         float: Значение метрики
     """
 
-    def calc_mtld_base(text):
+    def calc_mtld_base(ids):
         """Подсчет базовой метрики MTLD"""
         factor = 0
         factor_len = 0
         start = 0
-        for n in range(len(text)):
-            factor_text = text[start : n + 1]
-            if n + 1 == len(text):
-                factor += (1 - calc_ttr(factor_text)) / (1 - 0.72)
-                factor_len += len(factor_text)
-            else:
-                if calc_ttr(factor_text) < 0.72 and len(factor_text) >= min_len:
-                    factor += 1
-                    factor_len += len(factor_text)
-                    start = n + 1
-                else:
-                    continue
+        n_lexemes = 0
+        # Начало сегмента, в котором лексема встретилась последней
+        seen = [-1] * len(ids)
+        for n, lexeme in enumerate(ids):
+            if seen[lexeme] != start:
+                seen[lexeme] = start
+                n_lexemes += 1
+            length = n - start + 1
+            ttr = n_lexemes / length
+            if n + 1 == len(ids):
+                factor += (1 - ttr) / (1 - 0.72)
+                factor_len += length
+            elif ttr < 0.72 and length >= min_len:
+                factor += 1
+                factor_len += length
+                start = n + 1
+                n_lexemes = 0
         mtld_base = safe_divide(factor_len, factor)
         return mtld_base
 
-    mltd_forward = calc_mtld_base(text)
-    mltd_backward = calc_mtld_base(list(reversed(text)))
+    ids, _ = _encode_words(text)
+    mltd_forward = calc_mtld_base(ids)
+    mltd_backward = calc_mtld_base(ids[::-1])
     mtld = (mltd_forward + mltd_backward) / 2
     return mtld
 
@@ -430,32 +483,36 @@ def calc_mamtld(text: List[str], min_len: int = 10) -> float:
         float: Значение метрики
     """
 
-    def calc_mamtld_base(text):
+    def calc_mamtld_base(ids):
         """Подсчет базовой метрики MAMTLD"""
         factor = 0
         factor_len = 0
-        for n in range(len(text)):
-            sub_text = text[n:]
-            breaker = False
-            for m in range(len(sub_text)):
-                if not breaker:
-                    factor_text = sub_text[: m + 1]
-                    if calc_ttr(factor_text) < 0.72 and len(factor_text) >= min_len:
-                        factor += 1
-                        factor_len += len(factor_text)
-                        breaker = True
-                    else:
-                        continue
+        # Начало сегмента, в котором лексема встретилась последней
+        seen = [-1] * len(ids)
+        for n in range(len(ids) - min_len + 1):
+            n_lexemes = 0
+            for m in range(n, len(ids)):
+                if seen[ids[m]] != n:
+                    seen[ids[m]] = n
+                    n_lexemes += 1
+                length = m - n + 1
+                if n_lexemes / length < 0.72 and length >= min_len:
+                    factor += 1
+                    factor_len += length
+                    break
         mamtld_base = safe_divide(factor_len, factor, 1)
         return mamtld_base
 
-    mamtld_forward = calc_mamtld_base(text)
-    mamtld_backward = calc_mamtld_base(list(reversed(text)))
+    ids, _ = _encode_words(text)
+    mamtld_forward = calc_mamtld_base(ids)
+    mamtld_backward = calc_mamtld_base(ids[::-1])
     mamtld = (mamtld_forward + mamtld_backward) / 2
     return mamtld
 
 
-def calc_hdd(text: List[str], sample_size: int = 42) -> float:
+def calc_hdd(
+    text: List[str], sample_size: int = 42, freqs: Optional[Dict[str, int]] = None
+) -> float:
     """
     Вычисление метрики Hypergeometric Distribution D (HD-D)
 
@@ -467,44 +524,32 @@ def calc_hdd(text: List[str], sample_size: int = 42) -> float:
     Аргументы:
         text (list[str]): Список слов
         sample_size (int): Длина сегмента
+        freqs (dict[str, int]): Частоты слов (вычисляются по списку слов, если не указаны)
 
     Вывод:
         float: Значение метрики
     """
-
-    def hyper(successes, sample_size, population_size, freq):
-        """
-        Вероятность появления слова по крайней мере в одном сегменте, каждый из которых
-        сформирован на основе гипергеометрического распределения
-        """
-        try:
-            prob = 1.0 - (
-                float(
-                    (
-                        comb(freq, successes)
-                        * comb((population_size - freq), (sample_size - successes))
-                    )
-                )
-                / float(comb(population_size, sample_size))
-            )
-            prob = prob * (1 / sample_size)
-        except ZeroDivisionError:
-            prob = 0
-        return prob
-
     n_words = len(text)
     if n_words < 50:
         return -1
-    hdd = 0.0
-    lexemes = list(set(text))
-    freqs = Counter(text)
-    for lexeme in lexemes:
-        prob = hyper(0, sample_size, n_words, freqs[lexeme])
-        hdd += prob
+    if sample_size <= 0 or sample_size > n_words:
+        return 0.0
+    if freqs is None:
+        freqs = Counter(text)
+    # Вероятность отсутствия слова в сегменте по гипергеометрическому распределению
+    rest = n_words - np.fromiter(freqs.values(), dtype=np.int64, count=len(freqs))
+    log_probs = (
+        gammaln(rest + 1)
+        - gammaln(np.maximum(rest - sample_size, 0) + 1)
+        - gammaln(n_words + 1)
+        + gammaln(n_words - sample_size + 1)
+    )
+    probs = np.where(rest >= sample_size, np.exp(log_probs), 0.0)
+    hdd = float(np.sum(1.0 - probs)) / sample_size
     return hdd
 
 
-def calc_simpson_index(text: List[str]) -> float:
+def calc_simpson_index(text: List[str], freqs: Optional[Dict[str, int]] = None) -> float:
     """
     Вычисление индекса Симпсона
 
@@ -515,22 +560,21 @@ def calc_simpson_index(text: List[str]) -> float:
 
     Аргументы:
         text (list[str]): Список слов
+        freqs (dict[str, int]): Частоты слов (вычисляются по списку слов, если не указаны)
 
     Вывод:
         float: Значение индекса
     """
     n_words = len(text)
     den = n_words * (n_words - 1)
-    perms = permutations(text, 2)
-    counter = 0
-    for perm in perms:
-        if perm[0] == perm[1]:
-            counter += 1
+    if freqs is None:
+        freqs = Counter(text)
+    counter = sum(freq * (freq - 1) for freq in freqs.values())
     simpson_index = safe_divide(den, counter)
     return simpson_index
 
 
-def calc_hapax_index(text: List[str]) -> float:
+def calc_hapax_index(text: List[str], freqs: Optional[Dict[str, int]] = None) -> float:
     """
     Вычисление Гапакс-индекса
 
@@ -545,15 +589,17 @@ def calc_hapax_index(text: List[str]) -> float:
 
     Аргументы:
         text (list[str]): Список слов
+        freqs (dict[str, int]): Частоты слов (вычисляются по списку слов, если не указаны)
 
     Вывод:
         float: Значение индекса
     """
     n_words = len(text)
-    n_lexemes = len(set(text))
+    if freqs is None:
+        freqs = Counter(text)
+    n_lexemes = len(freqs)
     num = 100 * log10(n_words)
-    freqs = FreqDist(text)
-    hapaxes = len(freqs.hapaxes())
+    hapaxes = sum(1 for freq in freqs.values() if freq == 1)
     den = 1 - (safe_divide(hapaxes, n_lexemes))
     hapax_index = safe_divide(num, den)
     return hapax_index
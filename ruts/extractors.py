@@ -1,13 +1,158 @@
-from typing import Any, Callable, List, Pattern, Tuple, Union
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Pattern, Tuple, Union
 
+import os
 import re
+import sys
 from abc import ABCMeta, abstractmethod
-from collections import Counter
+from collections import Counter, OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
 
-import pymorphy2
 from razdel import sentenize, tokenize
 
 from .constants import PUNCTUATIONS
+from .utils import get_morph_analyzer
+
+# Токены, отбрасываемые фильтром пунктуации: все подстроки строки знаков препинания
+_PUNCTUATION_TOKENS = frozenset(
+    PUNCTUATIONS[start:end]
+    for start in range(len(PUNCTUATIONS) + 1)
+    for end in range(start, len(PUNCTUATIONS) + 1)
+)
+
+# Количество текстов, результаты извлечения из которых хранятся в кэше
+_CACHE_SIZE = 128
+
+# Быстрые токенизаторы на регулярных выражениях (уступают razdel в точности)
+# Слова начинаются с буквы или цифры, поэтому не могут состоять из знаков препинания
+_FAST_WORDS_PATTERN = re.compile(r"\d+(?:[.,]\d+)*|[^\W_]\w*(?:-\w+)*")
+_FAST_SENTS_PATTERN = re.compile(r"(?<=[.!?…])\s+(?=[\"«—–\-A-ZА-ЯЁ\d])")
+
+# Инструмент для извлечения слов в рабочем процессе extract_batch
+_worker_words_extractor = None
+
+
+@lru_cache(maxsize=65536)
+def _lemmatize(word: str) -> str:
+    """
+    Получение леммы слова
+
+    Аргументы:
+        word (str): Строка слова
+
+    Вывод:
+        str: Лемма слова
+    """
+    return get_morph_analyzer().normal_forms(word)[0]
+
+
+def _tokenize_sents(text: str) -> List[str]:
+    """
+    Токенизатор предложений по умолчанию
+
+    Аргументы:
+        text (str): Строка текста
+
+    Вывод:
+        sents (list[str]): Список предложений
+    """
+    return [sent.text for sent in sentenize(text)]
+
+
+def _tokenize_words(text: str) -> List[str]:
+    """
+    Токенизатор слов по умолчанию
+
+    Аргументы:
+        text (str): Строка текста
+
+    Вывод:
+        words (list[str]): Список слов
+    """
+    return [word.text for word in tokenize(text)]
+
+
+def _iter_words(text: str) -> Iterator[str]:
+    """
+    Ленивый токенизатор слов по умолчанию
+
+    Аргументы:
+        text (str): Строка текста
+
+    Вывод:
+        words (iterator[str]): Итератор слов
+    """
+    return (word.text for word in tokenize(text))
+
+
+def _tokenize_sents_fast(text: str) -> List[str]:
+    """
+    Быстрый токенизатор предложений на регулярном выражении
+
+    Аргументы:
+        text (str): Строка текста
+
+    Вывод:
+        sents (list[str]): Список предложений
+    """
+    return [sent for sent in _FAST_SENTS_PATTERN.split(text.strip()) if sent]
+
+
+def _tokenize_words_fast(text: str) -> List[str]:
+    """
+    Быстрый токенизатор слов на регулярном выражении
+
+    Аргументы:
+        text (str): Строка текста
+
+    Вывод:
+        words (list[str]): Список слов
+    """
+    return _FAST_WORDS_PATTERN.findall(text)
+
+
+def _get_tokenize(tokenizer: Union[Pattern, Callable]) -> Callable[[str], Iterable[str]]:
+    """
+    Получение функции токенизации по токенизатору или регулярному выражению
+
+    Аргументы:
+        tokenizer (pattern|callable): Токенизатор или регулярное выражение
+
+    Вывод:
+        callable: Функция токенизации
+
+    Исключения:
+        TypeError: Если некорректно задан токенизатор
+    """
+    if isinstance(tokenizer, Pattern):
+        return tokenizer.split
+    if callable(tokenizer):
+        return tokenizer
+    raise TypeError("Токенизатор задан некорректно")
+
+
+def _init_words_worker(config: Dict[str, Any]) -> None:
+    """
+    Создание инструмента для извлечения слов в рабочем процессе
+
+    Аргументы:
+        config (dict[str, Any]): Аргументы конструктора WordsExtractor
+    """
+    global _worker_words_extractor
+    _worker_words_extractor = WordsExtractor(**config)
+
+
+def _extract_words(text: str) -> Tuple[str, ...]:
+    """
+    Извлечение слов из текста в рабочем процессе
+
+    Аргументы:
+        text (str): Строка текста
+
+    Вывод:
+        words (tuple[str]): Кортеж извлеченных слов
+    """
+    return _worker_words_extractor.extract(text)
 
 
 class Extractor(metaclass=ABCMeta):
@@ -30,11 +175,34 @@ class Extractor(metaclass=ABCMeta):
         self.tokenizer = tokenizer
         self.min_len = min_len
         self.max_len = max_len
+        self.__tokenizer = None
+        self.__tokenize = None
 
     @abstractmethod
     def extract(self) -> Tuple[str, ...]:
         raise NotImplementedError
 
+    def _tokenize(self, text: str) -> Iterable[str]:
+        """
+        Токенизация текста текущим токенизатором
+
+        Функция токенизации определяется заново только при замене атрибута tokenizer
+
+        Аргументы:
+            text (str): Строка текста
+
+        Вывод:
+            iterable[str]: Токены текста
+
+        Исключения:
+            TypeError: Если некорректно задан токенизатор
+        """
+        tokenizer = self.tokenizer
+        if self.__tokenize is None or self.__tokenizer is not tokenizer:
+            self.__tokenize = _get_tokenize(tokenizer)
+            self.__tokenizer = tokenizer
+        return self.__tokenize(text)
+
 
 class SentsExtractor(Extractor):
     """
@@ -52,12 +220,14 @@ class SentsExtractor(Extractor):
         tokenizer (pattern|callable): Токенизатор или регулярное выражение
         min_len (int): Минимальная длина извлекаемого предложения
         max_len (int): Максимальная длина извлекаемого предложения
+        fast (bool): Использовать быстрый токенизатор на регулярных выражениях вместо razdel
 
     Методы:
         extract: Извлечение предложений из текста
 
     Исключения:
         ValueError: Если минимальная длина предложения больше максимальной
+        TypeError: Если некорректно задан токенизатор
     """
 
     def __init__(
@@ -65,13 +235,16 @@ class SentsExtractor(Extractor):
         tokenizer: Union[Pattern, Callable] = None,
         min_len: int = 0,
         max_len: int = 0,
+        fast: bool = False,
     ):
         super().__init__(tokenizer, min_len, max_len)
         if self.min_len and self.max_len and self.min_len > self.max_len:
             raise ValueError("Минимальная длина предложения больше максимальной")
+        self.fast = fast
         self.sents = ()
         if not self.tokenizer:
-            self.tokenizer = lambda text: (sent.text for sent in sentenize(text))
+            self.tokenizer = _tokenize_sents_fast if self.fast else _tokenize_sents
+        _get_tokenize(self.tokenizer)
 
     def extract(self, text: str) -> Tuple[str, ...]:
         """
@@ -82,22 +255,23 @@ class SentsExtractor(Extractor):
 
         Вывод:
             sents (tuple[str]): Кортеж извлеченных предложений
+        """
+        sents = self._tokenize(text)
+        if self.min_len > 0 or self.max_len > 0:
+            min_len = self.min_len
+            max_len = self.max_len if self.max_len > 0 else sys.maxsize
+            sents = (sent for sent in sents if min_len <= len(sent) <= max_len)
+        self.sents = tuple(sents)
+        return self.sents
+
+    def _get_config(self) -> Dict[str, Any]:
+        """
+        Получение параметров извлечения для создания копии инструмента
 
-        Исключения:
-            TypeError: Если некорректно задан токенизатор
+        Вывод:
+            dict[str, Any]: Аргументы конструктора SentsExtractor
         """
-        if isinstance(self.tokenizer, Pattern):
-            self.sents = re.split(self.tokenizer, text)
-        else:
-            try:
-                self.sents = self.tokenizer(text)
-            except Exception:
-                raise TypeError("Токенизатор задан некорректно")
-        if self.min_len > 0:
-            self.sents = (sent for sent in self.sents if len(sent) >= self.min_len)
-        if self.max_len > 0:
-            self.sents = (sent for sent in self.sents if len(sent) <= self.max_len)
-        return tuple(self.sents)
+        return {"tokenizer": self.tokenizer, "min_len": self.min_len, "max_len": self.max_len}
 
 
 class WordsExtractor(Extractor):
@@ -123,14 +297,20 @@ class WordsExtractor(Extractor):
         ngram_range (tuple[int, int]): Нижняя и верхняя граница размера N-грамм
         min_len (int): Минимальная длина извлекаемого слова
         max_len (int): Максимальная длина извлекаемого слова
+        fast (bool): Использовать быстрый токенизатор на регулярных выражениях вместо razdel
+        cache (bool): Кэшировать результаты извлечения для последних обработанных текстов
+        stopwords_are_lemmas (bool): Сравнивать стоп-слова с леммами, а не с исходными словами
 
     Методы:
         extract: Извлечение слов из текста
+        extract_iter: Ленивое извлечение слов из текста
+        extract_batch: Извлечение слов из набора текстов в нескольких процессах
         get_most_common: Получение счетчика топ-слов
 
     Исключения:
         ValueError: Если нижняя граница N-грамм большей верхней
         ValueError: Если минимальная длина слова больше максимальной
+        TypeError: Если некорректно задан токенизатор
     """
 
     def __init__(
@@ -144,12 +324,16 @@ class WordsExtractor(Extractor):
         ngram_range: Tuple[int, int] = (1, 1),
         min_len: int = 0,
         max_len: int = 0,
+        fast: bool = False,
+        cache: bool = False,
+        stopwords_are_lemmas: bool = True,
     ):
         super().__init__(tokenizer, min_len, max_len)
         self.filter_punct = filter_punct
         self.filter_nums = filter_nums
         self.use_lexemes = use_lexemes
-        self.stopwords = stopwords
+        self.stopwords = frozenset(stopwords) if stopwords else None
+        self.stopwords_are_lemmas = stopwords_are_lemmas
         self.lowercase = lowercase
         self.ngram_range = ngram_range
         if self.ngram_range[0] > self.ngram_range[1]:
@@ -158,9 +342,15 @@ class WordsExtractor(Extractor):
         self.max_len = max_len
         if self.min_len and self.max_len and self.min_len > self.max_len:
             raise ValueError("Минимальная длина слова больше максимальной")
+        self.fast = fast
+        self.cache = cache
         self.words = ()
         if not self.tokenizer:
-            self.tokenizer = lambda text: (word.text for word in tokenize(text))
+            self.tokenizer = _tokenize_words_fast if self.fast else _tokenize_words
+        _get_tokenize(self.tokenizer)
+        self._cache = OrderedDict()
+        self._counter = None
+        self._counter_words = None
 
     def extract(
         self,
@@ -174,36 +364,65 @@ class WordsExtractor(Extractor):
 
         Вывод:
             words (tuple[str]): Кортеж извлеченных слов
+        """
+        if self.cache:
+            key = self.__cache_key(text)
+            if key in self._cache:
+                self._cache.move_to_end(key)
+                self.words = self._cache[key]
+                return self.words
+        words = tuple(self.__filter_words(self._tokenize(text)))
+        if self.ngram_range != (1, 1):
+            words = self.__make_ngrams(words)
+        self.words = words
+        if self.cache:
+            self._cache[key] = self.words
+            if len(self._cache) > _CACHE_SIZE:
+                self._cache.popitem(last=False)
+        return self.words
+
+    def extract_iter(self, text: str) -> Iterator[str]:
+        """
+        Ленивое извлечение слов из текста
 
-        Исключения:
-            TypeError: Если некорректно задан токенизатор
+        Извлеченные слова не сохраняются в атрибуте words. Токенизатор по умолчанию
+        выдает токены по мере обработки, остальные токенизаторы предварительно формируют
+        список токенов. При формировании N-грамм слова текста предварительно собираются целиком
+
+        Аргументы:
+            text (str): Строка текста
+
+        Вывод:
+            words (iterator[str]): Итератор извлеченных слов
         """
-        if isinstance(self.tokenizer, Pattern):
-            self.words = (word for word in re.split(self.tokenizer, text))
-        else:
-            try:
-                self.words = (word for word in self.tokenizer(text))
-            except Exception:
-                raise TypeError("Токенизатор задан некорректно")
-        if self.filter_punct:
-            self.words = (word for word in self.words if word not in PUNCTUATIONS)
-        if self.filter_nums:
-            self.words = (word for word in self.words if not word.isnumeric())
-        if self.use_lexemes:
-            morph = pymorphy2.MorphAnalyzer()
-            self.words = (morph.parse(word)[0].normal_form for word in self.words)
-        if self.stopwords:
-            self.words = (word for word in self.words if word not in self.stopwords)
-        if self.lowercase:
-            self.words = (word.lower() for word in self.words)
-        if self.min_len > 0:
-            self.words = (word for word in self.words if len(word) >= self.min_len)
-        if self.max_len > 0:
-            self.words = (word for word in self.words if len(word) <= self.max_len)
-        self.words = tuple(self.words)
         if self.ngram_range != (1, 1):
-            self.words = self.__make_ngrams()
-        return tuple(self.words)
+            return iter(self.__make_ngrams(tuple(self.__filter_words(self._tokenize(text)))))
+        if self.tokenizer is _tokenize_words:
+            return self.__filter_words(_iter_words(text))
+        return self.__filter_words(self._tokenize(text))
+
+    def extract_batch(self, texts: Iterable[str], workers: int = None) -> List[Tuple[str, ...]]:
+        """
+        Извлечение слов из набора текстов в нескольких процессах
+
+        Извлеченные слова не сохраняются в атрибуте words
+
+        Аргументы:
+            texts (Iterable[str]): Набор текстов
+            workers (int): Количество процессов (по умолчанию - количество ядер процессора)
+
+        Вывод:
+            list[tuple[str]]: Кортежи извлеченных слов в порядке следования текстов
+        """
+        texts = list(texts)
+        workers = workers or os.cpu_count() or 1
+        chunksize = max(1, len(texts) // (workers * 4))
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_words_worker,
+            initargs=(self._get_config(),),
+        ) as executor:
+            return list(executor.map(_extract_words, texts, chunksize=chunksize))
 
     def get_most_common(self, n: int = 10) -> List[Tuple[Any, int]]:
         """
@@ -220,19 +439,106 @@ class WordsExtractor(Extractor):
         """
         if n < 1:
             raise ValueError("Количество слов должно быть больше 0")
-        return Counter(self.words).most_common(n)
+        if self._counter_words is not self.words:
+            self._counter = Counter(self.words)
+            self._counter_words = self.words
+        return self._counter.most_common(n)
+
+    def _get_config(self) -> Dict[str, Any]:
+        """
+        Получение параметров извлечения для создания копии инструмента
+
+        Вывод:
+            dict[str, Any]: Аргументы конструктора WordsExtractor
+        """
+        return {
+            "tokenizer": self.tokenizer,
+            "filter_punct": self.filter_punct,
+            "filter_nums": self.filter_nums,
+            "use_lexemes": self.use_lexemes,
+            "stopwords": list(self.stopwords) if self.stopwords else None,
+            "lowercase": self.lowercase,
+            "ngram_range": self.ngram_range,
+            "min_len": self.min_len,
+            "max_len": self.max_len,
+            "stopwords_are_lemmas": self.stopwords_are_lemmas,
+            "cache": self.cache,
+        }
+
+    def __cache_key(self, text: str) -> Tuple[Any, ...]:
+        """
+        Формирование ключа кэша из текста и текущих параметров извлечения
+
+        Аргументы:
+            text (str): Строка текста
 
-    def __make_ngrams(self) -> Tuple[str, ...]:
+        Вывод:
+            tuple: Ключ кэша
+        """
+        return (
+            text,
+            self.tokenizer,
+            self.filter_punct,
+            self.filter_nums,
+            self.use_lexemes,
+            frozenset(self.stopwords) if self.stopwords else None,
+            self.stopwords_are_lemmas,
+            self.lowercase,
+            tuple(self.ngram_range),
+            self.min_len,
+            self.max_len,
+        )
+
+    def __filter_words(self, tokens: Iterable[str]) -> Iterator[str]:
+        """
+        Фильтрация и нормализация слов за один проход
+
+        Аргументы:
+            tokens (iterable[str]): Токены текста
+
+        Вывод:
+            words (iterator[str]): Итератор отфильтрованных слов
+        """
+        filter_punct = self.filter_punct and self.tokenizer is not _tokenize_words_fast
+        filter_nums = self.filter_nums
+        use_lexemes = self.use_lexemes
+        stopwords = self.stopwords
+        surface_stopwords = None
+        if use_lexemes and not self.stopwords_are_lemmas:
+            surface_stopwords, stopwords = stopwords, None
+        lowercase = self.lowercase
+        min_len = self.min_len
+        max_len = self.max_len
+        for word in tokens:
+            if filter_punct and word in _PUNCTUATION_TOKENS:
+                continue
+            if filter_nums and word.isnumeric():
+                continue
+            if surface_stopwords and (word.lower() if lowercase else word) in surface_stopwords:
+                continue
+            if use_lexemes:
+                word = _lemmatize(word)
+            if stopwords and word in stopwords:
+                continue
+            if lowercase:
+                word = word.lower()
+            if min_len > 0 and len(word) < min_len:
+                continue
+            if max_len > 0 and len(word) > max_len:
+                continue
+            yield word
+
+    def __make_ngrams(self, words: Tuple[str, ...]) -> Tuple[str, ...]:
         """
         Формирование N-грамм
 
+        Аргументы:
+            words (tuple[str]): Кортеж слов
+
         Вывод:
             ngrams (tuple[str]): Кортеж извлеченных N-грамм
         """
-        ngrams: Tuple[str, ...] = ()
+        ngrams: List[str] = []
         for n in range(self.ngram_range[0], self.ngram_range[1] + 1):
-            ngrams += tuple(
-                "_".join(tuple(self.words)[i : i + n])
-                for i in range(len(tuple(self.words)) - n + 1)
-            )
-        return ngrams
+            ngrams.extend(map("_".join, zip(*(words[i:] for i in range(n)))))
+        return tuple(ngrams)
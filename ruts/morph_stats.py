@@ -1,12 +1,32 @@
 from typing import Dict, Tuple, Union
 
 from collections import Counter, OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
 
 import pymorphy2
 from spacy.tokens import Doc
 
 from .constants import MORPHOLOGY_STATS_DESC
 from .extractors import WordsExtractor
+from .utils import get_morph_analyzer
+
+# Минимальное количество уникальных слов, при котором разбор распределяется по процессам
+_PARALLEL_MIN_WORDS = 10000
+
+
+@lru_cache(maxsize=200000)
+def _parse_tag(word: str) -> pymorphy2.tagset.OpencorporaTag:
+    """
+    Получение тэга OpenCorpora наиболее вероятного разбора слова
+
+    Аргументы:
+        word (str): Строка слова
+
+    Вывод:
+        OpencorporaTag: Тэг слова
+    """
+    return get_morph_analyzer().parse(word)[0].tag
 
 
 class MorphStats:
@@ -42,6 +62,7 @@ class MorphStats:
     Аргументы:
         source (str|Doc): Источник данных (строка или объект Doc)
         words_extractor (WordsExtractor): Инструмент для извлечения слов
+        workers (int): Количество процессов для морфологического разбора
 
     Атрибуты:
         words (tuple[str]): Кортеж извлеченных слов
@@ -69,7 +90,9 @@ class MorphStats:
         ValueError: Если в источнике данных отсутствуют слова
     """
 
-    def __init__(self, source: Union[str, Doc], words_extractor: WordsExtractor = None):
+    def __init__(
+        self, source: Union[str, Doc], words_extractor: WordsExtractor = None, workers: int = 1
+    ):
         if isinstance(source, Doc):
             text = source.text
             self.words = tuple(word.text for word in source)
@@ -83,20 +106,67 @@ class MorphStats:
         if not self.words:
             raise ValueError("В источнике данных отсутствуют слова")
 
-        morph = pymorphy2.MorphAnalyzer()
-        self.tags = tuple(morph.parse(word)[0].tag for word in self.words)
-        self.pos = tuple(tag.POS for tag in self.tags)
-        self.animacy = tuple(tag.animacy for tag in self.tags)
-        self.aspect = tuple(tag.aspect for tag in self.tags)
-        self.case = tuple(tag.case for tag in self.tags)
-        self.gender = tuple(tag.gender for tag in self.tags)
-        self.involvement = tuple(tag.involvement for tag in self.tags)
-        self.mood = tuple(tag.mood for tag in self.tags)
-        self.number = tuple(tag.number for tag in self.tags)
-        self.person = tuple(tag.person for tag in self.tags)
-        self.tense = tuple(tag.tense for tag in self.tags)
-        self.transitivity = tuple(tag.transitivity for tag in self.tags)
-        self.voice = tuple(tag.voice for tag in self.tags)
+        self.tags = self.__parse_tags(self.words, workers)
+        (
+            self.pos,
+            self.animacy,
+            self.aspect,
+            self.case,
+            self.gender,
+            self.involvement,
+            self.mood,
+            self.number,
+            self.person,
+            self.tense,
+            self.transitivity,
+            self.voice,
+        ) = zip(
+            *(
+                (
+                    tag.POS,
+                    tag.animacy,
+                    tag.aspect,
+                    tag.case,
+                    tag.gender,
+                    tag.involvement,
+                    tag.mood,
+                    tag.number,
+                    tag.person,
+                    tag.tense,
+                    tag.transitivity,
+                    tag.voice,
+                )
+                for tag in self.tags
+            )
+        )
+
+    @staticmethod
+    def __parse_tags(
+        words: Tuple[str, ...], workers: int
+    ) -> Tuple[pymorphy2.tagset.OpencorporaTag, ...]:
+        """
+        Морфологический разбор слов
+
+        Уникальные слова распределяются по процессам, если их достаточно много
+
+        Аргументы:
+            words (tuple[str]): Кортеж слов
+            workers (int): Количество процессов
+
+        Вывод:
+            tuple[OpencorporaTag]: Кортеж тэгов OpenCorpora
+        """
+        if workers <= 1:
+            return tuple(map(_parse_tag, words))
+        unique_words = list(dict.fromkeys(words))
+        if len(unique_words) < _PARALLEL_MIN_WORDS:
+            return tuple(map(_parse_tag, words))
+        chunksize = max(256, len(unique_words) // (workers * 4))
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            tags = dict(
+                zip(unique_words, executor.map(_parse_tag, unique_words, chunksize=chunksize))
+            )
+        return tuple(map(tags.__getitem__, words))
 
     def get_stats(
         self, *args: Tuple[str, ...], filter_none: bool = False
@@ -117,10 +187,11 @@ class MorphStats:
             self.__check_stat(*args)
         stats = {}
         for arg in args:
+            counter = Counter(getattr(self, arg))
             if filter_none:
-                stats[arg] = {k: v for (k, v) in dict(Counter(vars(self).get(arg))).items() if k}
+                stats[arg] = {k: v for (k, v) in counter.items() if k}
             else:
-                stats[arg] = dict(Counter(vars(self).get(arg)))
+                stats[arg] = dict(counter)
         return stats
 
     def explain_text(
@@ -6,10 +6,16 @@ import tarfile
 import urllib.parse
 import urllib.request
 import zipfile
+from functools import lru_cache
 from pathlib import Path
 
+import pymorphy2
+
 from .constants import DEFAULT_DATA_DIR, RU_VOWELS
 
+# Безопасное извлечение файлов из TAR-архивов, если поддерживается версией Python
+TAR_EXTRACT_KWARGS = {"filter": "data"} if hasattr(tarfile, "data_filter") else {}
+
 
 def count_syllables(word: str) -> int:
     """
@@ -24,6 +30,20 @@ def count_syllables(word: str) -> int:
     return sum((1 for char in word if char in RU_VOWELS))
 
 
+@lru_cache(maxsize=None)
+def get_morph_analyzer() -> pymorphy2.MorphAnalyzer:
+    """
+    Получение морфологического анализатора pymorphy2
+
+    Анализатор создается при первом вызове и переиспользуется во всем процессе,
+    так как загрузка словарей занимает значительное время
+
+    Вывод:
+        MorphAnalyzer: Морфологический анализатор
+    """
+    return pymorphy2.MorphAnalyzer()
+
+
 def to_path(path: Union[str, Path]) -> Path:
     """
     Перевод строкового представления пути в объект Path
@@ -110,13 +130,16 @@ def extract_archive(archive_file: Union[str, Path], extract_dir: Union[str, Path
         return str(extract_dir)
     else:
         print(f"Извлечение файлов из архива {archive_file}...")
-        shutil.unpack_archive(archive_file, extract_dir=extract_dir, format=None)
         if is_zip:
             with zipfile.ZipFile(archive_file, mode="r") as f1:
                 members = f1.namelist()
+                f1.extractall(extract_dir)
         else:
-            with tarfile.open(archive_file, mode="r") as f2:
-                members = f2.getnames()
+            members = []
+            with tarfile.open(archive_file, mode="r|*") as f2:
+                for member in f2:
+                    f2.extract(member, path=extract_dir, **TAR_EXTRACT_KWARGS)
+                    members.append(member.name)
         src_basename = os.path.commonpath(members)
         dest_basename = os.path.basename(archive_file)
         if src_basename:
@@ -1,6 +1,9 @@
+import os
+import pickle
+
 import pytest
 
-from ruts.datasets.dataset import Dataset
+from ruts.datasets.dataset import RECORDS_CACHE_VERSION, Dataset
 
 
 class TestErrorDataset(Dataset):
@@ -59,3 +62,66 @@ def test_methods(dataset, name):
     assert hasattr(dataset, name)
     with pytest.raises(NotImplementedError):
         getattr(dataset, name)()
+
+
+@pytest.fixture
+def records_loader(tmp_path):
+    dirpath = tmp_path / "label"
+    dirpath.mkdir()
+    (dirpath / "1").write_text("a")
+    calls = []
+
+    def load_records(path):
+        calls.append(path)
+        return [
+            {"text": (path / name).read_text(), "file": path / name}
+            for name in sorted(os.listdir(path))
+        ]
+
+    return dirpath, load_records, calls
+
+
+def test_load_cached_records(tmp_path, records_loader):
+    dirpath, load_records, calls = records_loader
+    records = Dataset._load_cached_records(dirpath, load_records)
+    assert (tmp_path / "label.pkl").is_file()
+    assert Dataset._load_cached_records(dirpath, load_records) == records
+    assert len(calls) == 1
+    (dirpath / "2").write_text("b")
+    os.utime(dirpath, ns=(0, 0))
+    assert len(Dataset._load_cached_records(dirpath, load_records)) == 2
+    assert len(calls) == 2
+
+
+def test_load_cached_records_file_changed(records_loader):
+    dirpath, load_records, calls = records_loader
+    Dataset._load_cached_records(dirpath, load_records)
+    (dirpath / "1").write_text("b")
+    os.utime(dirpath / "1", ns=(2**62, 2**62))
+    assert Dataset._load_cached_records(dirpath, load_records)[0]["text"] == "b"
+    assert len(calls) == 2
+
+
+def test_load_cached_records_version(tmp_path, records_loader):
+    dirpath, load_records, calls = records_loader
+    Dataset._load_cached_records(dirpath, load_records)
+    with open(tmp_path / "label.pkl", "rb") as f:
+        version, mtime, records = pickle.load(f)
+    assert version == RECORDS_CACHE_VERSION
+    with open(tmp_path / "label.pkl", "wb") as f:
+        pickle.dump((version - 1, mtime, records), f)
+    Dataset.clear_cache()
+    Dataset._load_cached_records(dirpath, load_records)
+    assert len(calls) == 2
+
+
+def test_clear_cache(tmp_path, records_loader):
+    dirpath, load_records, calls = records_loader
+    Dataset._load_cached_records(dirpath, load_records)[0]["text"] = "b"
+    assert Dataset._load_cached_records(dirpath, load_records)[0]["text"] == "a"
+    (tmp_path / "label.pkl").unlink()
+    Dataset._load_cached_records(dirpath, load_records)
+    assert len(calls) == 1
+    Dataset.clear_cache()
+    Dataset._load_cached_records(dirpath, load_records)
+    assert len(calls) == 2
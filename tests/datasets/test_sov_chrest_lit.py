@@ -102,6 +102,22 @@ def test_get_records_author(dataset, author, expected):
     assert len(records) == expected
 
 
+def test_get_records_cache(dataset):
+    records = list(dataset.get_records())
+    assert os.path.isfile(os.path.join(dataset.data_dir, "sov_chrest_lit", "grade_1.pkl"))
+    assert list(dataset.get_records()) == records
+    assert all(os.path.isfile(record["file"]) for record in records)
+
+
+def test_get_records_book_author(dataset):
+    records = list(
+        dataset.get_records(
+            book="Родная речь. Книга для чтения в I классе начальной школы", author="Михалков"
+        )
+    )
+    assert len(records) == 4
+
+
 @pytest.mark.parametrize(
     "bad_filter",
     [
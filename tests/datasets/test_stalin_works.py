@@ -102,6 +102,18 @@ def test_get_records_topic(dataset, topic, expected):
     assert len(records) == expected
 
 
+def test_get_records_cache(dataset):
+    records = list(dataset.get_records(volume=1))
+    assert os.path.isfile(os.path.join(dataset.data_dir, "stalin_works", "volume_1.pkl"))
+    assert list(dataset.get_records(volume=1)) == records
+    assert all(os.path.isfile(record["file"]) for record in records)
+
+
+def test_get_records_source_subject(dataset):
+    records = list(dataset.get_records(source="Правда", subject="Съезд"))
+    assert len(records) == 123
+
+
 @pytest.mark.parametrize(
     "bad_filter",
     [
@@ -1,16 +1,19 @@
+import re
+
 import pytest
 
-from ruts import BasicStats
+from ruts import BasicStats, SentsExtractor, WordsExtractor
 from ruts.constants import BASIC_STATS_DESC
 
-
-@pytest.fixture(scope="module")
-def bs():
-    text = "Тезаурусы - особый класс лексикографических ресурсов, для которых характерны следующие черты: полнота\
+text = "Тезаурусы - особый класс лексикографических ресурсов, для которых характерны следующие черты: полнота\
         значений словарного состава языка или какого-либо его сегмента; тематический, или идеографический способ\
         упорядочения значений слов. Отличительной особенностью тезаурусов по сравнению с формальными онтологиями\
         является выход в сферу лексических значений, установление связей не только между значениями и выражающими их\
         словами, а также между самими значениями (регистрация различных семантических отношений внутри словаря)."
+
+
+@pytest.fixture(scope="module")
+def bs():
     bs_ = BasicStats(text, normalize=True)
     return bs_
 
@@ -150,3 +153,21 @@ def test_print_stats(capsys, bs):
     bs.print_stats()
     captured = capsys.readouterr()
     assert captured.out.count("|") == 14
+
+
+def test_from_texts(bs):
+    stats = BasicStats.from_texts([text, text], normalize=True, workers=2)
+    assert len(stats) == 2
+    for bs_ in stats:
+        assert isinstance(bs_, BasicStats)
+        assert bs_.get_stats() == bs.get_stats()
+
+
+def test_from_texts_extractors():
+    words_extractor = WordsExtractor(lowercase=True, cache=True)
+    sents_extractor = SentsExtractor(tokenizer=re.compile(r"[;.]"))
+    stats = BasicStats.from_texts(
+        [text], sents_extractor=sents_extractor, words_extractor=words_extractor, workers=2
+    )
+    expected = BasicStats(text, sents_extractor=sents_extractor, words_extractor=words_extractor)
+    assert stats[0].get_stats() == expected.get_stats()
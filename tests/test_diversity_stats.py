@@ -1,8 +1,17 @@
+from collections import Counter
+
 import pytest
 
 from ruts import DiversityStats
 from ruts.constants import DIVERSITY_STATS_DESC
-from ruts.diversity_stats import calc_hdd, calc_mattr, calc_msttr, calc_ttr
+from ruts.diversity_stats import (
+    calc_hapax_index,
+    calc_hdd,
+    calc_mattr,
+    calc_msttr,
+    calc_simpson_index,
+    calc_ttr,
+)
 
 
 @pytest.fixture(scope="module")
@@ -104,6 +113,18 @@ def test_hapax_index(ds):
     assert ds.hapax_index == pytest.approx(2499.4617690150753, rel=1)
 
 
+@pytest.mark.parametrize(
+    "func",
+    [
+        calc_hdd,
+        calc_simpson_index,
+        calc_hapax_index,
+    ],
+)
+def test_freqs(ds, func):
+    assert func(ds.words, freqs=Counter(ds.words)) == func(ds.words)
+
+
 def test_get_stats(ds):
     stats = ds.get_stats()
     assert isinstance(stats, dict)
@@ -1,6 +1,7 @@
 import re
 
 import pytest
+import razdel
 from nltk.corpus import stopwords
 from nltk.tokenize import sent_tokenize, wordpunct_tokenize
 
@@ -40,6 +41,19 @@ class TestSentsExtractor:
         se = SentsExtractor(tokenizer=tokenizer)
         assert len(tuple(se.extract(text))) == expected
 
+    def test_extract_tokenizer_reassign(self, text):
+        se = SentsExtractor()
+        se.extract(text)
+        se.tokenizer = re.compile(r"[;.]")
+        assert len(se.extract(text)) == 4
+        se.tokenizer = 666  # type: ignore
+        with pytest.raises(TypeError):
+            se.extract(text)
+
+    def test_extract_fast(self, text):
+        se = SentsExtractor(fast=True)
+        assert se.extract(text) == SentsExtractor().extract(text)
+
     @pytest.mark.parametrize(
         "min_len, expected",
         [(400, 0), (250, 1)],
@@ -90,6 +104,10 @@ class TestWordsExtractor:
         we = WordsExtractor(tokenizer=tokenizer)
         assert len(we.extract(text)) == expected
 
+    def test_extract_fast(self, text):
+        we = WordsExtractor(fast=True)
+        assert we.extract(text) == WordsExtractor().extract(text)
+
     def test_extract_filter_punct(self, text):
         we = WordsExtractor(filter_punct=False)
         assert len(we.extract(text)) == 72
@@ -113,6 +131,30 @@ class TestWordsExtractor:
         we = WordsExtractor(stopwords=stopwords)
         assert len(we.extract(text)) == expected
 
+    @pytest.mark.parametrize(
+        "stopwords, stopwords_are_lemmas, expected",
+        [
+            (["значение"], True, 0),
+            (["значение"], False, 5),
+            (["значений"], False, 2),
+        ],
+    )
+    def test_extract_stopwords_are_lemmas(self, text, stopwords, stopwords_are_lemmas, expected):
+        we = WordsExtractor(
+            use_lexemes=True, stopwords=stopwords, stopwords_are_lemmas=stopwords_are_lemmas
+        )
+        assert we.extract(text).count("значение") == expected
+
+    @pytest.mark.parametrize("lowercase, expected", [(True, 1), (False, 2)])
+    def test_extract_stopwords_are_lemmas_lowercase(self, text, lowercase, expected):
+        we = WordsExtractor(
+            use_lexemes=True,
+            stopwords=["тезаурусы"],
+            lowercase=lowercase,
+            stopwords_are_lemmas=False,
+        )
+        assert we.extract(text).count("тезаурус") == expected
+
     @pytest.mark.parametrize(
         "min_len, expected",
         [(6, 41), (3, 54)],
@@ -134,6 +176,59 @@ class TestWordsExtractor:
         assert len(we.extract(text)) == 180
         assert "формальными_онтологиями_является" in we.words
 
+    def test_extract_cache(self, text):
+        we = WordsExtractor(cache=True)
+        words = we.extract(text)
+        we.extract(text[:50])
+        assert we.extract(text) is words
+        assert we.words is words
+
+    def test_extract_cache_config_change(self, text):
+        we = WordsExtractor(cache=True)
+        words = we.extract(text)
+        we.lowercase = True
+        assert we.extract(text) == WordsExtractor(lowercase=True).extract(text)
+        we.lowercase = False
+        assert we.extract(text) is words
+
+    def test_extract_cache_tokenizer_reassign(self, text):
+        we = WordsExtractor(cache=True)
+        we.extract(text)
+        we.tokenizer = re.compile(r"\s+")
+        words = we.extract(text)
+        assert words == WordsExtractor(tokenizer=re.compile(r"\s+")).extract(text)
+        assert we.extract(text) is words
+
+    def test_extract_batch(self, text):
+        we = WordsExtractor(lowercase=True, stopwords=["значений"])
+        words = we.extract_batch([text, text[:50]], workers=2)
+        assert we.words == ()
+        assert words == [
+            we.extract(text),
+            we.extract(text[:50]),
+        ]
+
+    @pytest.mark.parametrize("ngram_range", [(1, 1), (1, 3)])
+    def test_extract_iter(self, text, ngram_range):
+        we = WordsExtractor(ngram_range=ngram_range)
+        words = we.extract_iter(text)
+        assert not isinstance(words, tuple)
+        assert we.words == ()
+        assert tuple(words) == WordsExtractor(ngram_range=ngram_range).extract(text)
+
+    def test_extract_iter_lazy(self, monkeypatch, text):
+        consumed = []
+
+        def tokenize(text_):
+            for token in razdel.tokenize(text_):
+                consumed.append(token)
+                yield token
+
+        monkeypatch.setattr("ruts.extractors.tokenize", tokenize)
+        words = WordsExtractor().extract_iter(text)
+        assert next(words) == "Тезаурусы"
+        assert len(consumed) == 1
+
     def test_get_most_common_value_error(self):
         with pytest.raises(ValueError):
             we = WordsExtractor()
@@ -143,3 +238,10 @@ class TestWordsExtractor:
         we = WordsExtractor()
         we.extract(text)
         assert we.get_most_common(1) == [("значений", 3)]
+
+    def test_get_most_common_after_extract(self, text):
+        we = WordsExtractor()
+        we.extract(text)
+        assert we.get_most_common(1) == [("значений", 3)]
+        we.extract("Слово слово слово")
+        assert we.get_most_common(1) == [("слово", 2)]
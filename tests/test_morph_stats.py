@@ -25,6 +25,13 @@ def test_init_type_error(text):
         MorphStats(text)
 
 
+def test_init_workers(monkeypatch, ms):
+    monkeypatch.setattr("ruts.morph_stats._PARALLEL_MIN_WORDS", 0)
+    ms_ = MorphStats(" ".join(ms.words), workers=2)
+    assert ms_.tags == ms.tags
+    assert ms_.pos == ms.pos
+
+
 def test_pos(ms):
     assert ms.pos == (
         "VERB",
@@ -3,7 +3,13 @@ from pathlib import Path
 
 import pytest
 
-from ruts.utils import download_file, extract_archive, safe_divide, to_path
+from ruts.utils import (
+    download_file,
+    extract_archive,
+    get_morph_analyzer,
+    safe_divide,
+    to_path,
+)
 
 
 def test_to_path_is_str():
@@ -57,6 +63,19 @@ def test_extract_archive():
     shutil.rmtree("/tmp/ruts_download", ignore_errors=True)
 
 
+def test_extract_tar_xz_archive(tmp_path):
+    archive_file = tmp_path / "sov_chrest_lit.tar.xz"
+    shutil.copy(
+        Path(__file__).parent.parent / "ruts/datasets/data/sov_chrest_lit.tar.xz", archive_file
+    )
+    assert extract_archive(archive_file) == str(tmp_path / "sov_chrest_lit")
+    assert (tmp_path / "sov_chrest_lit" / "grade_1").is_dir()
+
+
 @pytest.mark.parametrize("args, result", [((1, 5), 0.2), ((1, 0), 0), ((1, "", -1), -1)])
 def test_safe_divide(args, result):
     assert safe_divide(*args) == result
+
+
+def test_get_morph_analyzer():
+    assert get_morph_analyzer() is get_morph_analyzer()